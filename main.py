@@ -18,13 +18,20 @@ Usage:
 
 import os
 import sys
+import functools
+import hashlib
 import json
+import mmap
+import multiprocessing
+import queue
 import re
+import shutil
 import subprocess
-from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, List, Tuple, Optional
-import time
+import tarfile
+import threading
+from pathlib import Path, PurePosixPath
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional
 import urllib.request
 import urllib.error
 import importlib
@@ -57,20 +64,60 @@ def install_package(package_name: str, import_name: str = None) -> bool:
             print(f"Could not import {import_name} after installation")
             return False
 
-REQUESTS_AVAILABLE = install_package("requests")
-PYMUPDF_AVAILABLE = install_package("PyMuPDF", "fitz")
+# Probing imports (PyMuPDF especially) is slow, so remember a successful check per interpreter
+DEPS_SENTINEL = Path.home() / ".cache" / "epstein_downloader" / "deps_ok"
+DEPS_KEY = f"{sys.executable} {sys.version}"
+
+
+def deps_already_checked() -> bool:
+    try:
+        return DEPS_SENTINEL.read_text() == DEPS_KEY
+    except OSError:
+        return False
+
+
+# Resolved by check_dependencies() from main(), not at import time: pool workers re-import this
+# module, and must neither re-run the probe nor disagree with the parent about what is available
+REQUESTS_AVAILABLE = PYMUPDF_AVAILABLE = IJSON_AVAILABLE = False
+
+
+def set_dependency_flags(requests_ok: bool, pymupdf_ok: bool, ijson_ok: bool):
+    global REQUESTS_AVAILABLE, PYMUPDF_AVAILABLE, IJSON_AVAILABLE
+    REQUESTS_AVAILABLE, PYMUPDF_AVAILABLE, IJSON_AVAILABLE = requests_ok, pymupdf_ok, ijson_ok
+
+
+def check_dependencies():
+    if deps_already_checked():
+        set_dependency_flags(True, True, True)
+        return
+    
+    set_dependency_flags(
+        install_package("requests"),
+        install_package("PyMuPDF", "fitz"),
+        install_package("ijson")
+    )
+    
+    if REQUESTS_AVAILABLE and PYMUPDF_AVAILABLE and IJSON_AVAILABLE:
+        try:
+            DEPS_SENTINEL.parent.mkdir(parents=True, exist_ok=True)
+            DEPS_SENTINEL.write_text(DEPS_KEY)
+        except OSError:
+            pass
+
+
+@functools.lru_cache(maxsize=None)
+def optional_module(import_name: str):
+    """Import an optional accelerator on first use; None if it isn't installed or won't load."""
+    try:
+        return importlib.import_module(import_name)
+    except ImportError:
+        return None
 
-if REQUESTS_AVAILABLE:
-    import requests
-if PYMUPDF_AVAILABLE:
-    import fitz
 
 BASE_DIR = Path(__file__).parent
 DOCS_DIR = BASE_DIR / "documents"
 EXTRACTED_DIR = BASE_DIR / "extracted_text"
-
-DOCS_DIR.mkdir(exist_ok=True)
-EXTRACTED_DIR.mkdir(exist_ok=True)
+MANIFEST_PATH = DOCS_DIR / ".manifest.json"
 
 IA_SOURCES = {
     "giuffre_maxwell": {
@@ -108,33 +155,111 @@ IA_SOURCES = {
 GITHUB_REPO = "epstein-docs/epstein-docs.github.io"
 GITHUB_FOLDERS = [f"IMAGES{str(i).zfill(3)}" for i in range(1, 13)]
 
+CHUNK_SIZE = 1024 * 1024
+PROGRESS_EVERY = 8
+MANIFEST_FLUSH_EVERY = 50
+TEXT_SLICE = 64 * 1024
+LARGE_PDF_BYTES = 200 * 1024 * 1024
+PAGES_PER_WORKER = 50
+
+INTERESTING_PATTERNS = {
+    "phone": r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',
+    "email": r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b',
+}
+INTERESTING_RE = re.compile("|".join(f"(?P<{name}>{p})" for name, p in INTERESTING_PATTERNS.items()))
 
-def download_file(url: str, dest: Path, show_progress: bool = True) -> bool:
+_manifest = None
+_manifest_dirty = 0
+_manifest_lock = threading.Lock()
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            
+            _session = requests.Session()
+            _session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+        return _session
+
+
+def download_file(url: str, dest: Path, show_progress: bool = True, expected_size: int = 0,
+                  sha1: Optional[str] = None, accept_gzip: bool = True) -> bool:
+    def finish(part: Path) -> bool:
+        # Verify before the data takes the final name, so a bad transfer never replaces a good file
+        if sha1 and file_sha1(part) != sha1:
+            print(f"\n    Checksum mismatch: {dest.name}")
+            part.unlink(missing_ok=True)
+            return False
+        os.replace(part, dest)
+        return True
+    
     try:
         dest.parent.mkdir(parents=True, exist_ok=True)
         
+        # Carriage-return progress is only meaningful on a terminal
+        show_progress = show_progress and sys.stdout.isatty()
+        
+        if expected_size and dest.exists() and dest.stat().st_size == expected_size:
+            return True
+        
+        # Partial data lives under a separate name until it is complete, so an interrupted
+        # download is never mistaken for a finished file, and is moved into place at the end
+        part = dest.with_name(dest.name + ".part")
+        existing = part.stat().st_size if part.exists() else 0
+        if expected_size and existing > expected_size:
+            existing = 0
+        if expected_size and existing == expected_size:
+            return finish(part)
+        
         if REQUESTS_AVAILABLE:
-            response = requests.get(url, stream=True, timeout=60)
-            response.raise_for_status()
-            total = int(response.headers.get('content-length', 0))
-            downloaded = 0
+            headers = {}
+            if accept_gzip:
+                # Range offsets would point into the compressed stream, so compressed transfers start over
+                existing = 0
+            else:
+                headers["Accept-Encoding"] = "identity"
+            if existing:
+                headers["Range"] = f"bytes={existing}-"
             
-            with open(dest, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=131072):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        if show_progress and total > 0:
-                            pct = downloaded / total * 100
-                            mb = downloaded / 1024 / 1024
-                            sys.stdout.write(f"\r    {pct:.1f}% ({mb:.1f} MB)")
-                            sys.stdout.flush()
+            with get_session().get(url, stream=True, timeout=60, headers=headers) as response:
+                if existing and response.status_code == 416:
+                    return finish(part)
+                response.raise_for_status()
+                
+                # A plain 200 means the server ignored the range, so start over
+                if response.status_code != 206:
+                    existing = 0
+                total = existing + int(response.headers.get('content-length', 0))
+                downloaded = existing
+                
+                # A buffer as large as a chunk passes each 1 MiB write straight through in one call,
+                # while still retrying the short writes a raw file object can return
+                response.raw.decode_content = True
+                with open(part, 'ab' if existing else 'wb', buffering=CHUNK_SIZE) as f:
+                    if not show_progress:
+                        shutil.copyfileobj(response.raw, f, length=CHUNK_SIZE)
+                    else:
+                        for i, chunk in enumerate(response.iter_content(chunk_size=CHUNK_SIZE), 1):
+                            if chunk:
+                                f.write(chunk)
+                                downloaded += len(chunk)
+                                if total > 0 and (i % PROGRESS_EVERY == 0 or downloaded >= total):
+                                    pct = downloaded / total * 100
+                                    mb = downloaded / 1024 / 1024
+                                    sys.stdout.write(f"\r    {pct:.1f}% ({mb:.1f} MB)")
+                                    sys.stdout.flush()
         else:
-            urllib.request.urlretrieve(url, dest)
+            urllib.request.urlretrieve(url, part)
         
         if show_progress:
             print()
-        return True
+        return finish(part)
     except Exception as e:
         print(f"\n    Error: {e}")
         return False
@@ -143,7 +268,7 @@ def download_file(url: str, dest: Path, show_progress: bool = True) -> bool:
 def get_json(url: str) -> Optional[dict]:
     try:
         if REQUESTS_AVAILABLE:
-            response = requests.get(url, timeout=30)
+            response = get_session().get(url, timeout=30)
             response.raise_for_status()
             return response.json()
         else:
@@ -154,7 +279,118 @@ def get_json(url: str) -> Optional[dict]:
         return None
 
 
-def download_from_internet_archive(source_key: str) -> Dict[str, int]:
+def load_manifest() -> Dict[str, Dict]:
+    global _manifest
+    with _manifest_lock:
+        if _manifest is None:
+            try:
+                with open(MANIFEST_PATH, 'r', encoding='utf-8') as f:
+                    _manifest = json.load(f)
+            except (OSError, ValueError):
+                _manifest = {}
+        return _manifest
+
+
+def manifest_key(path: Path) -> str:
+    return path.relative_to(DOCS_DIR).as_posix()
+
+
+def save_manifest():
+    global _manifest_dirty
+    manifest = load_manifest()
+    with _manifest_lock:
+        if not _manifest_dirty:
+            return
+        tmp_path = MANIFEST_PATH.with_suffix(".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, MANIFEST_PATH)
+        _manifest_dirty = 0
+
+
+def _mark_manifest_dirty():
+    global _manifest_dirty
+    with _manifest_lock:
+        _manifest_dirty += 1
+        flush = _manifest_dirty >= MANIFEST_FLUSH_EVERY
+    if flush:
+        save_manifest()
+
+
+def update_manifest(path: Path, sha1: Optional[str] = None):
+    st = path.stat()
+    entry = {"size": st.st_size, "mtime": st.st_mtime}
+    if sha1:
+        entry["sha1"] = sha1
+    manifest = load_manifest()
+    with _manifest_lock:
+        manifest[manifest_key(path)] = entry
+    _mark_manifest_dirty()
+
+
+def manifest_entry_current(entry: Dict, st: Optional[os.stat_result]) -> bool:
+    return st is not None and entry.get("size") == st.st_size and entry.get("mtime") == st.st_mtime
+
+
+def drop_manifest_entry(path: Path):
+    manifest = load_manifest()
+    with _manifest_lock:
+        manifest.pop(manifest_key(path), None)
+    _mark_manifest_dirty()
+
+
+def file_sha1(path: Path) -> str:
+    with open(path, 'rb') as f:
+        # file_digest hashes straight from the file's buffer in C; with OpenSSL 3 it picks up SHA-NI where available
+        if sys.version_info >= (3, 11):
+            return hashlib.file_digest(f, 'sha1').hexdigest()
+        
+        h = hashlib.sha1()
+        while chunk := f.read(CHUNK_SIZE):
+            h.update(chunk)
+        return h.hexdigest()
+
+
+def link_or_copy(src: Path, dest: Path):
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    if dest.exists():
+        dest.unlink()
+    try:
+        os.link(src, dest)
+    except OSError:
+        # Hard links can't cross filesystems
+        shutil.copy2(src, dest)
+
+
+def get_ia_pdf_files(identifier: str) -> Iterator[Dict]:
+    url = f"https://archive.org/metadata/{identifier}"
+    
+    if REQUESTS_AVAILABLE:
+        response = get_session().get(url, stream=True, timeout=30)
+        response.raise_for_status()
+        response.raw.decode_content = True
+        stream = response.raw
+    else:
+        stream = urllib.request.urlopen(url, timeout=30)
+    
+    with stream:
+        # Only name, size and checksum are needed, so filter entries as they are parsed
+        if IJSON_AVAILABLE:
+            import ijson
+            
+            files = ijson.items(stream, "files.item")
+        else:
+            files = json.load(stream).get("files", [])
+        
+        for f in files:
+            name = f.get("name", "")
+            if name.lower().endswith(".pdf"):
+                yield {"name": name, "size": int(f.get("size", 0)), "sha1": f.get("sha1")}
+
+
+def download_from_internet_archive(source_key: str, max_workers: int = 8,
+                                   pdf_queue: Optional[queue.Queue] = None,
+                                   failed_paths: Optional[set] = None) -> Dict[str, int]:
     if source_key not in IA_SOURCES:
         return {"downloaded": 0, "skipped": 0, "failed": 0}
     
@@ -164,42 +400,117 @@ def download_from_internet_archive(source_key: str) -> Dict[str, int]:
     
     print(f"\n  {source['name']} ({source['size']})")
     
-    metadata = get_json(f"https://archive.org/metadata/{identifier}")
-    if not metadata:
-        return {"downloaded": 0, "skipped": 0, "failed": 1}
-    
-    files = metadata.get("files", [])
-    pdf_files = [f for f in files if f.get("name", "").lower().endswith(".pdf")]
-    
-    if not pdf_files:
-        print(f"    No PDFs found")
-        return {"downloaded": 0, "skipped": 0, "failed": 0}
-    
     stats = {"downloaded": 0, "skipped": 0, "failed": 0}
+    found = 0
+    futures = {}
+    manifest = load_manifest()
+    # The collections overlap, so a file already fetched for another source is linked rather than re-downloaded
+    sha1_paths = {entry["sha1"]: key for key, entry in manifest.items() if entry.get("sha1")}
     
-    for pdf in pdf_files:
-        filename = pdf["name"]
-        dest_path = dest_dir / filename
-        expected_size = int(pdf.get("size", 0))
-        
-        if dest_path.exists():
-            if abs(dest_path.stat().st_size - expected_size) < 1024:
-                print(f"    Exists: {filename}")
-                stats["skipped"] += 1
-                continue
+    # Downloads start while the metadata is still being parsed
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Only the metadata stream is guarded here; a problem with one file shouldn't end the listing
+        pdfs = get_ia_pdf_files(identifier)
+        while True:
+            try:
+                pdf = next(pdfs, None)
+            except Exception as e:
+                print(f"    Error fetching metadata for {identifier}: {e}")
+                stats["failed"] += 1
+                break
+            if pdf is None:
+                break
+            
+            found += 1
+            filename = pdf["name"]
+            dest_path = dest_dir / filename
+            expected_size = pdf["size"]
+            sha1 = pdf["sha1"]
+            
+            try:
+                # The manifest caches each file's verified sha1; it only holds while the file on disk
+                # still has the recorded size and mtime, otherwise the file is checked again
+                st = dest_path.stat() if dest_path.exists() else None
+                entry = manifest.get(manifest_key(dest_path))
+                if entry and not manifest_entry_current(entry, st):
+                    drop_manifest_entry(dest_path)
+                    entry = None
+                size = st.st_size if st else None
+                
+                size_ok = size is not None and abs(size - expected_size) < 1024
+                
+                # Only a hashed file may be recorded under its sha1, since it can become a link source
+                if size_ok and sha1 and not (entry and entry.get("sha1")) and file_sha1(dest_path) != sha1:
+                    print(f"    Checksum mismatch: {filename}, downloading again")
+                    dest_path.unlink()
+                    if entry:
+                        drop_manifest_entry(dest_path)
+                    entry = None
+                    size_ok = False
+                
+                if size_ok:
+                    print(f"    Exists: {filename}")
+                    stats["skipped"] += 1
+                    if not entry or (sha1 and not entry.get("sha1")):
+                        update_manifest(dest_path, sha1)
+                        if sha1:
+                            sha1_paths[sha1] = manifest_key(dest_path)
+                    if pdf_queue is not None:
+                        pdf_queue.put(dest_path)
+                    continue
+                
+                if sha1 in sha1_paths:
+                    src_path = DOCS_DIR / sha1_paths[sha1]
+                    src_st = src_path.stat() if src_path.exists() else None
+                    src_entry = manifest.get(sha1_paths[sha1], {})
+                    if manifest_entry_current(src_entry, src_st) and src_st.st_size == expected_size:
+                        link_or_copy(src_path, dest_path)
+                        print(f"    Linked: {filename} (same as {sha1_paths[sha1]})")
+                        stats["skipped"] += 1
+                        update_manifest(dest_path, sha1)
+                        if pdf_queue is not None:
+                            pdf_queue.put(dest_path)
+                        continue
+                
+                url = f"https://archive.org/download/{identifier}/{filename}"
+                # PDFs are already compressed; gzip on top only burns CPU on both ends
+                future = executor.submit(download_file, url, dest_path, False, expected_size, sha1, accept_gzip=False)
+                futures[future] = (dest_path, sha1)
+            except Exception as e:
+                print(f"    Error: {filename}: {e}")
+                stats["failed"] += 1
+                if failed_paths is not None:
+                    failed_paths.add(dest_path)
         
-        print(f"    Downloading: {filename}")
-        url = f"https://archive.org/download/{identifier}/{filename}"
+        if not found and not stats["failed"]:
+            print(f"    No PDFs found")
+        if futures:
+            print(f"    Downloading {len(futures)} files...")
         
-        if download_file(url, dest_path):
-            stats["downloaded"] += 1
-        else:
-            stats["failed"] += 1
+        for i, future in enumerate(as_completed(futures)):
+            dest_path, sha1 = futures[future]
+            if future.result():
+                stats["downloaded"] += 1
+                update_manifest(dest_path, sha1)
+                if sha1:
+                    sha1_paths[sha1] = manifest_key(dest_path)
+                if pdf_queue is not None:
+                    pdf_queue.put(dest_path)
+            else:
+                stats["failed"] += 1
+                if failed_paths is not None:
+                    failed_paths.add(dest_path)
+            print(f"      {i+1}/{len(futures)}", end="\r")
     
+    save_manifest()
+    
+    if futures:
+        print(f"      {len(futures)} files - Downloaded: {stats['downloaded']}, Failed: {stats['failed']}")
     return stats
 
 
-def download_all_internet_archive() -> Dict[str, int]:
+def download_all_internet_archive(pdf_queue: Optional[queue.Queue] = None,
+                                  failed_paths: Optional[set] = None) -> Dict[str, int]:
     print("\n" + "=" * 70)
     print("INTERNET ARCHIVE - TEXT-SEARCHABLE PDFs")
     print("=" * 70)
@@ -209,81 +520,98 @@ def download_all_internet_archive() -> Dict[str, int]:
     sorted_sources = sorted(IA_SOURCES.keys(), key=lambda k: IA_SOURCES[k]["priority"])
     
     for key in sorted_sources:
-        stats = download_from_internet_archive(key)
+        stats = download_from_internet_archive(key, pdf_queue=pdf_queue, failed_paths=failed_paths)
         for k in total:
             total[k] += stats[k]
     
     return total
 
 
-def download_github_folder(folder: str, dest_dir: Path, max_workers: int = 10) -> Dict[str, int]:
-    api_url = f"https://api.github.com/repos/{GITHUB_REPO}/contents/results/{folder}"
-    
-    data = get_json(api_url)
-    if not data or not isinstance(data, list):
-        return {"downloaded": 0, "skipped": 0, "failed": 0}
+def write_github_txt(json_data: dict, dest_path: Path):
+    full_text = json_data.get("full_text", "")
+    metadata = json_data.get("document_metadata", {})
+    entities = json_data.get("entities", {})
     
-    json_files = [f for f in data if f["name"].endswith(".json")]
+    dest_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(dest_path, 'wb', buffering=1 << 20) as f:
+        f.write(("=" * 70 + "\nDOCUMENT METADATA\n" + "=" * 70 + "\n").encode('utf-8'))
+        for k, v in metadata.items():
+            f.write(f"{k}: {v}\n".encode('utf-8'))
+        
+        if entities:
+            f.write(("\n" + "-" * 70 + "\nENTITIES\n" + "-" * 70 + "\n").encode('utf-8'))
+            for etype, elist in entities.items():
+                if elist:
+                    if isinstance(elist, list):
+                        f.write(f"{etype}: {', '.join(str(e) for e in elist)}\n".encode('utf-8'))
+                    else:
+                        f.write(f"{etype}: {elist}\n".encode('utf-8'))
+        
+        f.write(("\n" + "=" * 70 + "\nFULL TEXT\n" + "=" * 70 + "\n").encode('utf-8'))
+        # Encode the body in slices so a large document never needs a second full-size copy
+        for i in range(0, len(full_text), TEXT_SLICE):
+            f.write(full_text[i:i + TEXT_SLICE].encode('utf-8'))
+
+
+def download_github_tarball(dest_dir: Path) -> Dict[str, int]:
     stats = {"downloaded": 0, "skipped": 0, "failed": 0}
+    seen = 0
     
-    def download_one(file_info):
-        filename = file_info["name"]
-        txt_filename = filename.replace(".json", ".txt")
-        dest_path = dest_dir / txt_filename
-        
-        if dest_path.exists():
-            return "skipped"
+    # The archive is the whole repository, so only fetch it when main has moved since the last full pass
+    commit_path = dest_dir / ".commit"
+    branch = get_json(f"https://api.github.com/repos/{GITHUB_REPO}/branches/main")
+    commit = branch["commit"]["sha"] if branch else None
+    if commit and commit_path.exists() and commit_path.read_text() == commit:
+        stats["skipped"] = sum(1 for _ in iter_files(dest_dir, ".txt"))
+        print(f"      Up to date with {commit[:7]} - Skipped: {stats['skipped']}")
+        return stats
+    
+    # One streamed archive instead of thousands of per-file API and raw requests
+    url = f"https://codeload.github.com/{GITHUB_REPO}/tar.gz/{commit or 'refs/heads/main'}"
+    
+    try:
+        if REQUESTS_AVAILABLE:
+            response = get_session().get(url, stream=True, timeout=60)
+            response.raise_for_status()
+            response.raw.decode_content = True
+            stream = response.raw
+        else:
+            stream = urllib.request.urlopen(url, timeout=60)
         
-        try:
-            json_data = get_json(file_info["download_url"])
-            if not json_data:
-                return "failed"
-            
-            full_text = json_data.get("full_text", "")
-            metadata = json_data.get("document_metadata", {})
-            entities = json_data.get("entities", {})
-            
-            lines = [
-                "=" * 70,
-                "DOCUMENT METADATA",
-                "=" * 70,
-            ]
-            for k, v in metadata.items():
-                lines.append(f"{k}: {v}")
-            
-            if entities:
-                lines.append("\n" + "-" * 70)
-                lines.append("ENTITIES")
-                lines.append("-" * 70)
-                for etype, elist in entities.items():
-                    if elist:
-                        if isinstance(elist, list):
-                            lines.append(f"{etype}: {', '.join(str(e) for e in elist)}")
-                        else:
-                            lines.append(f"{etype}: {elist}")
-            
-            lines.append("\n" + "=" * 70)
-            lines.append("FULL TEXT")
-            lines.append("=" * 70)
-            lines.append(full_text)
-            
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(dest_path, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(lines))
-            
-            return "downloaded"
-        except Exception as e:
-            return "failed"
+        with stream, tarfile.open(fileobj=stream, mode="r|gz") as tar:
+            for member in tar:
+                # Members are prefixed with the archive's top-level "<repo>-<ref>/" directory
+                parts = PurePosixPath(member.name).parts[1:]
+                if not member.isfile() or len(parts) != 3 or parts[0] != "results":
+                    continue
+                folder, filename = parts[1], parts[2]
+                if folder not in GITHUB_FOLDERS or not filename.endswith(".json"):
+                    continue
+                
+                seen += 1
+                if seen % 100 == 0:
+                    print(f"      {seen} files", end="\r")
+                
+                dest_path = dest_dir / folder / filename.replace(".json", ".txt")
+                if dest_path.exists():
+                    stats["skipped"] += 1
+                    continue
+                
+                try:
+                    json_data = json.load(tar.extractfile(member))
+                    write_github_txt(json_data, dest_path)
+                    stats["downloaded"] += 1
+                except Exception:
+                    stats["failed"] += 1
+    except Exception as e:
+        print(f"\n    Error fetching {url}: {e}")
+        stats["failed"] += 1
     
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = [executor.submit(download_one, f) for f in json_files]
-        for i, future in enumerate(as_completed(futures)):
-            result = future.result()
-            stats[result] += 1
-            if (i + 1) % 100 == 0 or i + 1 == len(json_files):
-                print(f"      {i+1}/{len(json_files)}", end="\r")
+    if commit and not stats["failed"]:
+        dest_dir.mkdir(parents=True, exist_ok=True)
+        commit_path.write_text(commit)
     
-    print(f"      {len(json_files)} files - Downloaded: {stats['downloaded']}, Skipped: {stats['skipped']}")
+    print(f"      {seen} files - Downloaded: {stats['downloaded']}, Skipped: {stats['skipped']}")
     return stats
 
 
@@ -302,130 +630,301 @@ def download_all_github() -> Dict[str, int]:
     else:
         print("\n  analyses.json already exists")
     
-    total = {"downloaded": 0, "skipped": 0, "failed": 0}
+    print(f"\n  {GITHUB_FOLDERS[0]}-{GITHUB_FOLDERS[-1]} (repository archive)")
+    return download_github_tarball(dest_dir)
+
+
+def _iter_doc_pages(doc, start: int, stop: int) -> Iterator[str]:
+    import fitz
     
-    for folder in GITHUB_FOLDERS:
-        print(f"\n  {folder}")
-        stats = download_github_folder(folder, dest_dir / folder)
-        for k in total:
-            total[k] += stats[k]
-        time.sleep(0.5)
+    with doc:
+        for page_num in range(start, stop):
+            # Plain dump: no ligature/whitespace preservation, but still drop text outside the page box
+            yield doc[page_num].get_text("text", flags=fitz.TEXT_MEDIABOX_CLIP)
+
+
+def _iter_page_range(pdf_path: Path, start: int, stop: int) -> Iterator[str]:
+    import fitz
     
-    return total
+    return _iter_doc_pages(fitz.open(pdf_path), start, stop)
+
 
+def _extract_page_range(pdf_path: Path, start: int, stop: int) -> List[str]:
+    return list(_iter_page_range(pdf_path, start, stop))
 
-def extract_pdf_text(pdf_path: Path) -> Tuple[str, Dict]:
+
+def _iter_page_blocks(pdf_path: Path, page_count: int, workers: int, executor: ProcessPoolExecutor) -> Iterator[str]:
+    block = -(-page_count // workers)
+    starts = list(range(0, page_count, block))
+    stops = [min(start + block, page_count) for start in starts]
+    for block_texts in executor.map(_extract_page_range, [pdf_path] * len(starts), starts, stops):
+        yield from block_texts
+
+
+def extract_pdf_text(pdf_path: Path, workers: int = 1, page_pool: Optional[ProcessPoolExecutor] = None) -> Tuple[int, Iterator[str]]:
+    poppler = None if PYMUPDF_AVAILABLE else optional_module("poppler")
+    if poppler is not None:
+        doc = poppler.load_from_file(str(pdf_path))
+        return doc.pages, (doc.create_page(i).text() for i in range(doc.pages))
+    
     if not PYMUPDF_AVAILABLE:
-        try:
-            result = subprocess.run(
-                ["pdftotext", "-layout", str(pdf_path), "-"],
-                capture_output=True, text=True, timeout=300
-            )
-            text = result.stdout
-            pages = text.split('\f')
-            return text, {
-                "pages": len(pages),
-                "blank_pages": sum(1 for p in pages if len(p.strip()) < 50)
-            }
-        except Exception as e:
-            return f"Error: {e}", {"error": str(e)}
+        result = subprocess.run(
+            ["pdftotext", "-layout", str(pdf_path), "-"],
+            capture_output=True, text=True, timeout=300
+        )
+        pages = result.stdout.split('\f')
+        return len(pages), iter(pages)
+    
+    import fitz
     
     doc = fitz.open(pdf_path)
-    all_text = []
-    page_data = []
+    page_count = doc.page_count
     
-    for page_num, page in enumerate(doc):
-        text = page.get_text("text")
-        is_blank = len(text.strip()) < 50
-        
-        page_data.append({
-            "page": page_num + 1,
-            "chars": len(text),
-            "blank": is_blank
-        })
-        
-        all_text.append(f"--- PAGE {page_num + 1} ---\n{text}")
+    workers = max(1, min(workers, page_count // PAGES_PER_WORKER))
+    if workers > 1 and page_pool is not None:
+        # Each worker opens the file itself, so this handle was only needed for the page count
+        doc.close()
+        return page_count, _iter_page_blocks(pdf_path, page_count, workers, page_pool)
+    return page_count, _iter_doc_pages(doc, 0, page_count)
+
+
+@functools.lru_cache(maxsize=None)
+def _interesting_hyperscan_db():
+    hyperscan = optional_module("hyperscan")
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[p.encode() for p in INTERESTING_PATTERNS.values()],
+        ids=list(range(len(INTERESTING_PATTERNS))),
+        flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(INTERESTING_PATTERNS)
+    )
+    return db
+
+
+def _find_interesting_hyperscan(text: str, limit: int) -> Dict[str, List[str]]:
+    hyperscan = optional_module("hyperscan")
+    data = text.encode('utf-8')
+    names = list(INTERESTING_PATTERNS)
+    spans = [{} for _ in names]
     
-    doc.close()
+    # Hyperscan reports every end offset of a match; keep the longest one per start like re would
+    def on_match(pattern_id, start, end, flags, context):
+        found = spans[pattern_id]
+        if start in found:
+            found[start] = max(found[start], end)
+        elif len(found) < limit:
+            found[start] = end
+        elif all(len(f) >= limit for f in spans):
+            return True
     
-    metadata = {
-        "pages": len(page_data),
-        "blank_pages": sum(1 for p in page_data if p["blank"])
-    }
+    try:
+        _interesting_hyperscan_db().scan(data, match_event_handler=on_match)
+    except hyperscan.ScanTerminated:
+        pass
     
-    return "\n\n".join(all_text), metadata
+    samples = {}
+    for name, found in zip(names, spans):
+        if found:
+            samples[name] = [data[start:end].decode('utf-8') for start, end in sorted(found.items())]
+    return samples
 
 
-def extract_all_pdfs() -> Dict[str, int]:
-    print("\n" + "=" * 70)
-    print("EXTRACTING PDF TEXT")
-    print("=" * 70)
+def find_interesting(text: str, limit: int = 5) -> Dict[str, List[str]]:
+    if optional_module("hyperscan") is not None:
+        return _find_interesting_hyperscan(text, limit)
     
-    pdf_dir = DOCS_DIR / "internet_archive"
-    if not pdf_dir.exists():
-        print("  No PDFs to extract yet")
-        return {"processed": 0, "skipped": 0, "failed": 0}
-    
-    pdfs = list(pdf_dir.rglob("*.pdf")) + list(pdf_dir.rglob("*.PDF"))
-    stats = {"processed": 0, "skipped": 0, "failed": 0}
+    samples = {}
+    for m in INTERESTING_RE.finditer(text):
+        bucket = samples.setdefault(m.lastgroup, [])
+        if len(bucket) < limit:
+            bucket.append(m.group())
+        elif len(samples) == INTERESTING_RE.groups and all(len(b) >= limit for b in samples.values()):
+            break
+    return samples
+
+
+def _process_one_pdf(pdf_path: Path, pdf_dir: Path, extracted_dir: Path, workers: int = 1,
+                     page_pool: Optional[ProcessPoolExecutor] = None) -> Tuple[str, List[Dict], str]:
+    rel_path = pdf_path.relative_to(pdf_dir)
+    txt_path = extracted_dir / "pdf_text" / rel_path.with_suffix(".txt")
+    part_path = txt_path.with_name(txt_path.name + ".part")
     
-    interesting_finds = []
+    if txt_path.exists():
+        return "skipped", [], f"  Already extracted: {rel_path.name}"
     
-    for pdf_path in pdfs:
-        rel_path = pdf_path.relative_to(pdf_dir)
-        txt_path = EXTRACTED_DIR / "pdf_text" / rel_path.with_suffix(".txt")
+    try:
+        page_count, pages = extract_pdf_text(pdf_path, workers, page_pool)
+        blank_pages = 0
+        samples = {}
         
-        if txt_path.exists():
-            print(f"  Already extracted: {rel_path.name}")
-            stats["skipped"] += 1
-            continue
+        txt_path.parent.mkdir(parents=True, exist_ok=True)
         
-        print(f"  Extracting: {rel_path.name}...")
+        # Pages are written as they are extracted, but the blank count heading them is only
+        # known at the end, so the body goes to a side file and is copied in after the header
+        with open(part_path, 'w', encoding='utf-8') as body:
+            for page_num, text in enumerate(pages):
+                if page_num:
+                    body.write("\f")
+                body.write(text)
+                
+                if len(text.strip()) < 50:
+                    blank_pages += 1
+                
+                if len(samples) < len(INTERESTING_PATTERNS) or any(len(b) < 5 for b in samples.values()):
+                    for name, found in find_interesting(text).items():
+                        bucket = samples.setdefault(name, [])
+                        bucket.extend(found[:5 - len(bucket)])
         
-        try:
-            text, metadata = extract_pdf_text(pdf_path)
-            
-            txt_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(txt_path, 'w', encoding='utf-8') as f:
-                f.write(f"SOURCE: {pdf_path.name}\n")
-                f.write(f"PAGES: {metadata.get('pages', 'unknown')}\n")
-                f.write(f"BLANK PAGES: {metadata.get('blank_pages', 'unknown')}\n")
-                f.write("=" * 70 + "\n\n")
-                f.write(text)
-            
-            stats["processed"] += 1
-            
-            patterns = [
-                (r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', "phone numbers"),
-                (r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', "emails"),
-            ]
-            
-            for pattern, desc in patterns:
-                matches = re.findall(pattern, text)
-                if matches:
-                    interesting_finds.append({
-                        "file": str(rel_path),
-                        "type": desc,
-                        "samples": matches[:5]
-                    })
-                    break
-            
-            print(f"    {metadata.get('pages', '?')} pages extracted")
+        with open(txt_path, 'w', encoding='utf-8') as f, open(part_path, 'rb') as body:
+            f.write(f"SOURCE: {pdf_path.name}\n")
+            f.write(f"PAGES: {page_count}\n")
+            f.write(f"BLANK PAGES: {blank_pages}\n")
+            f.write("=" * 70 + "\n\n")
+            f.flush()
+            shutil.copyfileobj(body, f.buffer, CHUNK_SIZE)
+        part_path.unlink()
+        
+        interesting_finds = []
+        if samples:
+            interesting_finds.append({
+                "file": str(rel_path),
+                "samples": samples
+            })
+        
+        return "processed", interesting_finds, f"  Extracted: {rel_path.name} ({page_count} pages)"
+        
+    except Exception as e:
+        # Don't leave a partial file behind that would count as already extracted next run
+        txt_path.unlink(missing_ok=True)
+        part_path.unlink(missing_ok=True)
+        return "failed", [], f"  Error extracting {rel_path.name}: {e}"
+
+
+def _process_pool(max_workers: int) -> ProcessPoolExecutor:
+    # Workers are started lazily from whichever thread submits first, possibly while download
+    # threads hold locks; forking then copies those locks, so start workers from a clean server.
+    start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else None
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context(start_method),
+        initializer=set_dependency_flags,
+        initargs=(REQUESTS_AVAILABLE, PYMUPDF_AVAILABLE, IJSON_AVAILABLE)
+    )
+
+
+def _extract_pdfs(pdf_paths: Iterable[Path], pdf_dir: Path, verbose: bool = True, defer_large: bool = True,
+                  stop: Optional[threading.Event] = None) -> Tuple[Dict[str, int], List[Dict]]:
+    stats = {"processed": 0, "skipped": 0, "failed": 0}
+    interesting_finds = []
+    
+    def stopped():
+        return stop is not None and stop.is_set()
+    
+    def record(status, finds, message):
+        stats[status] += 1
+        interesting_finds.extend(finds)
+        if verbose or status == "failed":
+            print(message)
+    
+    # MuPDF holds the GIL while parsing, so fan out across processes rather than threads.
+    # Capped so several multi-GB documents open at once don't exhaust memory.
+    max_workers = min(os.cpu_count() or 1, 6)
+    
+    # The few giant bundles dominate wall time; split each one's pages across every core instead.
+    # One pool is shared by all of them so worker start-up is paid once, not per document.
+    page_workers = os.cpu_count() or 1
+    page_pool = None
+    
+    def extract_large(pdf_path):
+        nonlocal page_pool
+        if page_pool is None:
+            page_pool = _process_pool(page_workers)
+        record(*_process_one_pdf(pdf_path, pdf_dir, EXTRACTED_DIR, page_workers, page_pool))
+    
+    seen = set()
+    large_pdfs = []
+    
+    executor = _process_pool(max_workers)
+    try:
+        futures = {}
+        # pdf_paths may be fed by a download still in progress; PDFs start extracting as they arrive
+        for pdf_path in pdf_paths:
+            if stopped():
+                break
+            if pdf_path in seen:
+                continue
+            seen.add(pdf_path)
+            try:
+                is_large = pdf_path.stat().st_size >= LARGE_PDF_BYTES
+            except OSError as e:
+                record("failed", [], f"  Error extracting {pdf_path.name}: {e}")
+                continue
             
-        except Exception as e:
-            print(f"    Error: {e}")
-            stats["failed"] += 1
+            if not is_large:
+                futures[executor.submit(_process_one_pdf, pdf_path, pdf_dir, EXTRACTED_DIR)] = pdf_path
+            elif defer_large:
+                # Held back so the page pool doesn't compete with the file pool for cores
+                large_pdfs.append(pdf_path)
+            else:
+                extract_large(pdf_path)
+        
+        for future in as_completed(futures):
+            if stopped():
+                break
+            try:
+                record(*future.result())
+            except Exception as e:
+                record("failed", [], f"  Error extracting {futures[future].name}: {e}")
+        
+        for pdf_path in large_pdfs:
+            if stopped():
+                break
+            extract_large(pdf_path)
+    finally:
+        # Once stopped, drop whatever hasn't started rather than working through it before exiting
+        executor.shutdown(cancel_futures=stopped())
+        if page_pool is not None:
+            page_pool.shutdown(cancel_futures=stopped())
     
+    return stats, interesting_finds
+
+
+def _save_interesting_finds(interesting_finds: List[Dict]):
     if interesting_finds:
         report_path = EXTRACTED_DIR / "interesting_finds.json"
         with open(report_path, 'w') as f:
             json.dump(interesting_finds, f, indent=2)
         print(f"\n  Interesting patterns saved to: {report_path}")
+
+
+def extract_all_pdfs() -> Dict[str, int]:
+    print("\n" + "=" * 70)
+    print("EXTRACTING PDF TEXT")
+    print("=" * 70)
+    
+    pdf_dir = DOCS_DIR / "internet_archive"
+    if not pdf_dir.exists():
+        print("  No PDFs to extract yet")
+        return {"processed": 0, "skipped": 0, "failed": 0}
+    
+    pdfs = list(pdf_dir.rglob("*.pdf")) + list(pdf_dir.rglob("*.PDF"))
+    stats, interesting_finds = _extract_pdfs(pdfs, pdf_dir)
+    _save_interesting_finds(interesting_finds)
     
     return stats
 
 
+def iter_files(root: Path, suffix: str) -> Iterator[os.DirEntry]:
+    # scandir entries carry cached stat info, avoiding a Path object and extra stat calls per file
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(suffix):
+                    yield entry
+
+
 def show_status():
     print("\n" + "=" * 70)
     print("DOWNLOAD STATUS")
@@ -438,34 +937,78 @@ def show_status():
     if ia_dir.exists():
         for source_key, source in IA_SOURCES.items():
             source_dir = ia_dir / source_key
-            if source_dir.exists():
-                pdfs = list(source_dir.glob("*.pdf"))
-                size = sum(p.stat().st_size for p in pdfs)
-                total_files += len(pdfs)
-                total_size += size
-                print(f"\n  {source['name']}")
-                print(f"     {len(pdfs)} PDFs ({size/1024/1024:.1f} MB)")
+            if not source_dir.exists():
+                continue
+            sizes = [e.stat().st_size for e in iter_files(source_dir, ".pdf")]
+            size = sum(sizes)
+            total_files += len(sizes)
+            total_size += size
+            print(f"\n  {source['name']}")
+            print(f"     {len(sizes)} PDFs ({size/1024/1024:.1f} MB)")
     
     github_dir = DOCS_DIR / "github_ocr"
     if github_dir.exists():
-        txts = list(github_dir.rglob("*.txt"))
-        total_files += len(txts)
+        txt_count = sum(1 for _ in iter_files(github_dir, ".txt"))
+        total_files += txt_count
         print(f"\n  GitHub OCR Documents")
-        print(f"     {len(txts)} text files")
+        print(f"     {txt_count} text files")
     
     if EXTRACTED_DIR.exists():
-        extracted = list(EXTRACTED_DIR.rglob("*.txt"))
+        extracted_count = sum(1 for _ in iter_files(EXTRACTED_DIR, ".txt"))
         print(f"\n  Extracted Text")
-        print(f"     {len(extracted)} files")
+        print(f"     {extracted_count} files")
     
     print(f"\n  TOTAL: {total_files} files ({total_size/1024/1024:.1f} MB)")
 
 
+def _grep_file(txt_file: str, pattern: re.Pattern, limit: int = 5) -> List[Tuple[int, str]]:
+    matches = []
+    with open(txt_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        line_num = 1
+        counted_to = 0
+        m = pattern.search(mm)
+        while m:
+            line_start = mm.rfind(b'\n', 0, m.start()) + 1
+            line_end = mm.find(b'\n', m.end())
+            if line_end == -1:
+                line_end = len(mm)
+            
+            # Count in bounded windows; slicing the whole prefix would copy it out of the map
+            for pos in range(counted_to, line_start, CHUNK_SIZE):
+                line_num += mm[pos:min(pos + CHUNK_SIZE, line_start)].count(b'\n')
+            counted_to = line_start
+            line = mm[line_start:line_end].decode('utf-8', errors='ignore')
+            matches.append((line_num, line.strip()[:100]))
+            if len(matches) >= limit:
+                break
+            
+            m = pattern.search(mm, line_end)
+    
+    return matches
+
+
+def _grep_lines(txt_file: str, term: str, limit: int = 5) -> List[Tuple[int, str]]:
+    needle = term.lower()
+    matches = []
+    with open(txt_file, 'r', encoding='utf-8', errors='ignore', newline='\n') as f:
+        for line_num, line in enumerate(f, 1):
+            if needle in line.lower():
+                matches.append((line_num, line.strip()[:100]))
+                if len(matches) >= limit:
+                    break
+    return matches
+
+
 def search_all(term: str):
     print(f"\n" + "=" * 70)
     print(f"SEARCHING FOR: {term}")
     print("=" * 70)
     
+    # A bytes pattern only folds ASCII case, so other terms are matched line by line as text
+    if term.isascii():
+        grep = functools.partial(_grep_file, pattern=re.compile(re.escape(term.encode('utf-8')), re.IGNORECASE))
+    else:
+        grep = functools.partial(_grep_lines, term=term)
     results = []
     search_dirs = [
         DOCS_DIR / "github_ocr",
@@ -476,20 +1019,17 @@ def search_all(term: str):
         if not search_dir.exists():
             continue
         
-        for txt_file in search_dir.rglob("*.txt"):
+        for entry in iter_files(search_dir, ".txt"):
             try:
-                with open(txt_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    if term.lower() in content.lower():
-                        matches = []
-                        for i, line in enumerate(content.split('\n')):
-                            if term.lower() in line.lower():
-                                matches.append((i + 1, line.strip()[:100]))
-                        
-                        results.append({
-                            "file": str(txt_file.relative_to(BASE_DIR)),
-                            "matches": matches[:5]
-                        })
+                # Empty files can't be mapped
+                if entry.stat().st_size == 0:
+                    continue
+                matches = grep(entry.path)
+                if matches:
+                    results.append({
+                        "file": os.path.relpath(entry.path, BASE_DIR),
+                        "matches": matches
+                    })
             except Exception:
                 pass
     
@@ -522,15 +1062,64 @@ def download_everything():
         "extracted": 0
     }
     
-    ia_stats = download_all_internet_archive()
-    total_stats["ia_downloaded"] = ia_stats["downloaded"]
-    total_stats["ia_skipped"] = ia_stats["skipped"]
+    # Extraction is CPU-bound and the downloads are network-bound, so extract each PDF
+    # in the background as soon as it is on disk instead of waiting for every download
+    pdf_dir = DOCS_DIR / "internet_archive"
+    pdf_queue = queue.Queue()
+    extraction = {"stats": {"processed": 0, "skipped": 0, "failed": 0}, "finds": [], "error": None}
+    # Partial files from failed downloads stay on disk for resume; keep them out of extraction
+    failed_paths = set()
+    # Set on Ctrl-C or a failed download stage so the extractor drops queued PDFs instead of holding up the exit
+    stop = threading.Event()
     
-    gh_stats = download_all_github()
-    total_stats["github_downloaded"] = gh_stats["downloaded"]
-    total_stats["github_skipped"] = gh_stats["skipped"]
+    def consume():
+        try:
+            extraction["stats"], extraction["finds"] = _extract_pdfs(
+                iter(pdf_queue.get, None), pdf_dir, verbose=False, defer_large=False, stop=stop
+            )
+        except Exception as e:
+            extraction["error"] = e
+    
+    extractor = threading.Thread(target=consume)
+    extractor.start()
+    
+    try:
+        ia_stats = download_all_internet_archive(pdf_queue, failed_paths)
+        total_stats["ia_downloaded"] = ia_stats["downloaded"]
+        total_stats["ia_skipped"] = ia_stats["skipped"]
+        
+        gh_stats = download_all_github()
+        total_stats["github_downloaded"] = gh_stats["downloaded"]
+        total_stats["github_skipped"] = gh_stats["skipped"]
+        
+        # Pick up PDFs left on disk by earlier runs that this run's listings didn't cover
+        if pdf_dir.exists():
+            for pdf_path in list(pdf_dir.rglob("*.pdf")) + list(pdf_dir.rglob("*.PDF")):
+                if pdf_path not in failed_paths:
+                    pdf_queue.put(pdf_path)
+    except BaseException:
+        stop.set()
+        raise
+    finally:
+        pdf_queue.put(None)
     
-    ext_stats = extract_all_pdfs()
+    print("\n" + "=" * 70)
+    print("EXTRACTING PDF TEXT")
+    print("=" * 70)
+    print("  Waiting for background extraction to finish...")
+    try:
+        extractor.join()
+    except KeyboardInterrupt:
+        stop.set()
+        raise
+    
+    if extraction["error"] is not None:
+        print(f"  Background extraction stopped early: {extraction['error']}")
+        print("  Run with --extract to finish extracting")
+    
+    ext_stats = extraction["stats"]
+    print(f"  Processed: {ext_stats['processed']}, Skipped: {ext_stats['skipped']}, Failed: {ext_stats['failed']}")
+    _save_interesting_finds(extraction["finds"])
     total_stats["extracted"] = ext_stats["processed"]
     
     print("\n" + "=" * 70)
@@ -569,6 +1158,10 @@ Examples:
     
     args = parser.parse_args()
     
+    check_dependencies()
+    DOCS_DIR.mkdir(exist_ok=True)
+    EXTRACTED_DIR.mkdir(exist_ok=True)
+    
     if args.all:
         download_everything()
     elif args.status: